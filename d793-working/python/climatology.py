@@ -0,0 +1,318 @@
+"""
+Climatology module for the Weather program
+Builds per-station, per-week-of-year temperature baselines and scores
+new weekly records against them
+Western Governors University
+Created November 2025
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from math import nan, sqrt
+from operator import sub, truediv
+from typing import List, Sequence, Set, Tuple
+
+from weather import Weather
+from weather_batch import WeatherBatch
+
+
+WEEKS_PER_YEAR = 53  # ISO week numbers run 1..53
+
+# Doubles stored per (station, week) cell
+_COUNT = 0
+_HIGH_MEAN = 1
+_HIGH_M2 = 2
+_LOW_MEAN = 3
+_LOW_M2 = 4
+_CELL_SIZE = 5
+
+_ITEM_SIZE = array('d').itemsize
+_STATION_SIZE = WEEKS_PER_YEAR * _CELL_SIZE
+
+# Baseline file header: magic, version, byte order of the doubles (0 little,
+# 1 big), padding so the doubles start 8-byte aligned, then the station count
+_MAGIC = b'WCLM'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBB2xq')
+_BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+
+class Climatology:
+    """
+    Historical baselines of weekly average high and low temperatures.
+    
+    For every station and ISO week of the year the running count, mean and
+    sum of squared deviations (M2) of the weekly average high and low are
+    kept with Welford's streaming update. All cells live in one flat array
+    of doubles, laid out station-major, which can be written to disk with
+    save() and memory-mapped back with load().
+    
+    Attributes:
+        _number_stations (int): Number of stations covered
+        _baselines (array | memoryview): Flat cell data of
+            _number_stations * WEEKS_PER_YEAR * 5 doubles
+        _mmap (mmap.mmap | None): Backing memory map when loaded from disk
+        _path (str | None): File backing the memory map
+    """
+    
+    def __init__(self, number_stations: int):
+        """
+        Initialize an empty Climatology.
+        
+        Args:
+            number_stations: Number of stations, indexed 0..number_stations-1
+        """
+        self._number_stations: int = number_stations
+        self._baselines = array('d', bytes(number_stations * _STATION_SIZE * _ITEM_SIZE))
+        self._mmap = None
+        self._path = None
+    
+    @classmethod
+    def load(cls, path: str, writable: bool = False) -> "Climatology":
+        """
+        Memory-map baselines previously written with save().
+        
+        Args:
+            path: File written by save()
+            writable: If True, updates are written through to the file
+        
+        Returns:
+            Climatology: Baselines backed by the mapped file
+        
+        Raises:
+            ValueError: If the file is not a baseline file for this machine
+        """
+        with open(path, 'r+b' if writable else 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0,
+                               access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        try:
+            if len(mapped) < _HEADER.size:
+                raise ValueError(f"{path} is not a climatology baseline file")
+            magic, version, byte_order, number_stations = _HEADER.unpack_from(mapped, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a climatology baseline file")
+            if version != _VERSION:
+                raise ValueError(f"Unsupported climatology baseline version {version}")
+            if byte_order != _BYTE_ORDER:
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+            if len(mapped) != _HEADER.size + number_stations * _STATION_SIZE * _ITEM_SIZE:
+                raise ValueError(f"{path} size does not match its station count")
+        except ValueError:
+            mapped.close()
+            raise
+        
+        climatology = cls.__new__(cls)
+        climatology._number_stations = number_stations
+        climatology._baselines = memoryview(mapped)[_HEADER.size:].cast('d')
+        climatology._mmap = mapped
+        climatology._path = path
+        return climatology
+    
+    def save(self, path: str) -> None:
+        """
+        Write the baselines to a file: a small header, then native doubles.
+        
+        Saving to the file backing a memory map just flushes the map. Any
+        other file is written to a temporary file in the same directory and
+        then moved into place, so a live mapping is never truncated.
+        
+        Args:
+            path: Destination file
+        """
+        if (self._mmap is not None and os.path.exists(path)
+                and os.path.samefile(path, self._path)):
+            if not self._baselines.readonly:
+                self._mmap.flush()
+            return
+        
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER, self._number_stations))
+                f.write(self._baselines)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def close(self) -> None:
+        """Release the memory map, if the baselines were loaded from disk."""
+        if self._mmap is not None:
+            self._baselines.release()
+            self._mmap.close()
+            self._mmap = None
+    
+    def _require_writable(self) -> None:
+        """
+        Check that the baselines can be updated.
+        
+        Raises:
+            ValueError: If the baselines were memory-mapped read-only
+        """
+        if self._mmap is not None and self._baselines.readonly:
+            raise ValueError("Climatology was loaded read-only; "
+                             "use Climatology.load(path, writable=True) to update it")
+    
+    def _cell(self, station: int, week: int) -> int:
+        """
+        Return the offset of a (station, week) cell in the flat array.
+        
+        Raises:
+            ValueError: If the station or week is out of range
+        """
+        if not 0 <= station < self._number_stations:
+            raise ValueError(f"Station {station} is out of range")
+        if not 1 <= week <= WEEKS_PER_YEAR:
+            raise ValueError(f"Week {week} is out of range")
+        return (station * WEEKS_PER_YEAR + week - 1) * _CELL_SIZE
+    
+    def _update_cell(self, cell: int, avg_high: float, avg_low: float) -> None:
+        """Apply one Welford update to a cell."""
+        b = self._baselines
+        n = b[cell + _COUNT] + 1
+        b[cell + _COUNT] = n
+        
+        delta = avg_high - b[cell + _HIGH_MEAN]
+        b[cell + _HIGH_MEAN] += delta / n
+        b[cell + _HIGH_M2] += delta * (avg_high - b[cell + _HIGH_MEAN])
+        
+        delta = avg_low - b[cell + _LOW_MEAN]
+        b[cell + _LOW_MEAN] += delta / n
+        b[cell + _LOW_M2] += delta * (avg_low - b[cell + _LOW_MEAN])
+    
+    def update(self, station: int, week: int, weather: Weather) -> None:
+        """
+        Add one historical week to a station's baseline.
+        
+        Args:
+            station: Station index
+            week: ISO week of the year (1-53)
+            weather: Historical weekly record
+        """
+        self._require_writable()
+        self._update_cell(self._cell(station, week),
+                          weather.calculate_average_fahrenheit_high_temp(),
+                          weather.calculate_average_fahrenheit_low_temp())
+    
+    def update_batch(self, batch: WeatherBatch, stations: Sequence[int],
+                     weeks: Sequence[int]) -> None:
+        """
+        Add every record of a batch to the baselines.
+        
+        Args:
+            batch: Historical weekly records
+            stations: Station index of each record
+            weeks: ISO week of the year of each record
+        """
+        self._require_writable()
+        offsets = self._cells(len(batch), stations, weeks)
+        highs = batch.calculate_average_fahrenheit_high_temp()
+        lows = batch.calculate_average_fahrenheit_low_temp()
+        for cell, avg_high, avg_low in zip(offsets, highs, lows):
+            self._update_cell(cell, avg_high, avg_low)
+    
+    def _cells(self, count: int, stations: Sequence[int],
+               weeks: Sequence[int]) -> List[int]:
+        """
+        Return the cell offset of every record, validating the whole batch once.
+        
+        Raises:
+            ValueError: If the lengths disagree or any index is out of range
+        """
+        if len(stations) != count or len(weeks) != count:
+            raise ValueError("stations and weeks must have one value per record")
+        if count == 0:
+            return []
+        if min(stations) < 0 or max(stations) >= self._number_stations:
+            raise ValueError("Station index out of range")
+        if min(weeks) < 1 or max(weeks) > WEEKS_PER_YEAR:
+            raise ValueError("Week out of range")
+        return [(s * WEEKS_PER_YEAR + w - 1) * _CELL_SIZE
+                for s, w in zip(stations, weeks)]
+    
+    def get_baseline(self, station: int, week: int) -> Tuple[int, float, float, float, float]:
+        """
+        Return the baseline statistics of one station and week.
+        
+        Args:
+            station: Station index
+            week: ISO week of the year (1-53)
+        
+        Returns:
+            Tuple: (count, mean high, variance high, mean low, variance low);
+            variances are sample variances and NaN below two observations
+        """
+        b = self._baselines
+        cell = self._cell(station, week)
+        n = int(b[cell + _COUNT])
+        if n < 2:
+            return (n, b[cell + _HIGH_MEAN], nan, b[cell + _LOW_MEAN], nan)
+        return (n, b[cell + _HIGH_MEAN], b[cell + _HIGH_M2] / (n - 1),
+                b[cell + _LOW_MEAN], b[cell + _LOW_M2] / (n - 1))
+    
+    def score(self, batch: WeatherBatch, stations: Sequence[int],
+              weeks: Sequence[int]) -> Tuple[array, array]:
+        """
+        Score every record of a batch as z-scores against its baseline.
+        
+        A z-score is NaN when the baseline has fewer than two observations
+        or zero variance.
+        
+        Args:
+            batch: Weekly records to score
+            stations: Station index of each record
+            weeks: ISO week of the year of each record
+        
+        Returns:
+            Tuple[array, array]: z-scores of the average high and average low
+        """
+        offsets = self._cells(len(batch), stations, weeks)
+        cells = set(offsets)
+        return (self._z_scores(cells, offsets, batch.calculate_average_fahrenheit_high_temp(),
+                               _HIGH_MEAN, _HIGH_M2),
+                self._z_scores(cells, offsets, batch.calculate_average_fahrenheit_low_temp(),
+                               _LOW_MEAN, _LOW_M2))
+    
+    def _z_scores(self, cells: Set[int], offsets: List[int], values: array,
+                  mean: int, m2: int) -> array:
+        """
+        Compute z-scores of values against one metric of their cells.
+        
+        The mean and standard deviation are worked out once per distinct
+        cell; the per-record step is then a C-level map over the batch.
+        A NaN standard deviation marks cells without a usable baseline.
+        """
+        b = self._baselines
+        means = {}
+        deviations = {}
+        for cell in cells:
+            n = b[cell + _COUNT]
+            means[cell] = b[cell + mean]
+            deviations[cell] = (sqrt(b[cell + m2] / (n - 1))
+                                if n >= 2 and b[cell + m2] > 0 else nan)
+        return array('d', map(truediv,
+                              map(sub, values, map(means.__getitem__, offsets)),
+                              map(deviations.__getitem__, offsets)))
+    
+    def find_anomalies(self, batch: WeatherBatch, stations: Sequence[int],
+                       weeks: Sequence[int], threshold: float = 2.0) -> List[int]:
+        """
+        Find records whose average high or low is unusual for the station and week.
+        
+        Args:
+            batch: Weekly records to check
+            stations: Station index of each record
+            weeks: ISO week of the year of each record
+            threshold: Absolute z-score at or above which a record is flagged
+        
+        Returns:
+            List[int]: Indices of the flagged records
+        """
+        z_high, z_low = self.score(batch, stations, weeks)
+        # NaN compares False, so records without a usable baseline are never flagged
+        return [i for i, (zh, zl) in enumerate(zip(z_high, z_low))
+                if abs(zh) >= threshold or abs(zl) >= threshold]
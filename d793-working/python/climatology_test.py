@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Climatology module
+Tests streaming baselines, z-score scoring and memory-mapped storage
+Western Governors University
+Created November 2025
+"""
+
+import os
+import statistics
+import tempfile
+import unittest
+from math import isnan
+
+from climatology import Climatology
+from weather import Weather
+from weather_batch import WeatherBatch
+
+
+class TestClimatology(unittest.TestCase):
+    """
+    Test Suite for the Climatology module
+    
+    Each test includes detailed output showing processing status and results.
+    """
+    
+    def setUp(self):
+        """
+        Set up historical weeks for station 0, week 10.
+        
+        Each week is a constant high/low so the weekly averages are known:
+        highs 70, 72, 74, 76 and lows 50, 51, 52, 53.
+        """
+        print("\n" + "="*70)
+        self.history = [Weather([h] * 7, [l] * 7, 7, 10, 'S')
+                        for h, l in [(70, 50), (72, 51), (74, 52), (76, 53)]]
+    
+    def test_1_welford_baseline_matches_statistics(self):
+        """
+        Test 1: Verify Streaming Baseline Mean and Variance
+        
+        Baselines built one record at a time and from a batch must both
+        match the mean and sample variance from the statistics module.
+        """
+        print("TEST 1: Processing streaming baseline construction...")
+        
+        single = Climatology(2)
+        for w in self.history:
+            single.update(0, 10, w)
+        
+        batched = Climatology(2)
+        batched.update_batch(WeatherBatch.from_weathers(self.history),
+                             [0] * 4, [10] * 4)
+        
+        expected = (4, statistics.mean([70, 72, 74, 76]), statistics.variance([70, 72, 74, 76]),
+                    statistics.mean([50, 51, 52, 53]), statistics.variance([50, 51, 52, 53]))
+        print(f"  Expected Baseline: {expected}")
+        print(f"  Actual Baseline:   {single.get_baseline(0, 10)}")
+        
+        for actual in (single.get_baseline(0, 10), batched.get_baseline(0, 10)):
+            self.assertEqual(actual[0], expected[0])
+            for a, e in zip(actual[1:], expected[1:]):
+                self.assertAlmostEqual(a, e, places=9)
+        self.assertEqual(single.get_baseline(1, 10)[0], 0,
+                        msg="Other stations must be unaffected")
+        
+        print("  ✓ PASS: Streaming baseline matches reference statistics")
+    
+    def test_2_score_and_find_anomalies(self):
+        """
+        Test 2: Verify Z-Score Scoring and Anomaly Flagging
+        
+        Baseline high mean is 73 with standard deviation ~2.58, so a week
+        averaging 73 scores 0 and a week averaging 90 is flagged. Records
+        without a baseline score NaN and are never flagged.
+        """
+        print("TEST 2: Processing z-score scoring...")
+        
+        climatology = Climatology(2)
+        for w in self.history:
+            climatology.update(0, 10, w)
+        
+        batch = WeatherBatch.from_weathers([
+            Weather([73] * 7, [51] * 7, 7, 10, 'S'),
+            Weather([90] * 7, [51] * 7, 7, 10, 'S'),
+            Weather([90] * 7, [51] * 7, 7, 10, 'S'),
+        ])
+        z_high, z_low = climatology.score(batch, [0, 0, 1], [10, 10, 10])
+        print(f"  Z High: {list(z_high)}")
+        print(f"  Z Low:  {list(z_low)}")
+        
+        sd_high = statistics.stdev([70, 72, 74, 76])
+        self.assertAlmostEqual(z_high[0], 0.0, places=9)
+        self.assertAlmostEqual(z_high[1], (90 - 73) / sd_high, places=9)
+        self.assertTrue(isnan(z_high[2]), msg="Missing baseline should score NaN")
+        self.assertEqual(climatology.find_anomalies(batch, [0, 0, 1], [10, 10, 10]), [1])
+        
+        with self.assertRaises(ValueError):
+            climatology.score(batch, [0, 0, 2], [10, 10, 10])
+        with self.assertRaises(ValueError):
+            climatology.score(batch, [0, 0, 0], [10, 10, 54])
+        
+        print("  ✓ PASS: Z-scores and anomaly flags are correct")
+    
+    def test_3_save_and_memory_map(self):
+        """
+        Test 3: Verify Baselines Round-Trip Through a Memory-Mapped File
+        
+        Saved baselines must load with the same statistics, and a writable
+        mapping must persist further updates to disk, including when saved
+        back to the file it was loaded from. Read-only mappings
+        must refuse updates, and files without a valid header must be rejected.
+        """
+        print("TEST 3: Processing memory-mapped baseline storage...")
+        
+        climatology = Climatology(3)
+        for w in self.history:
+            climatology.update(2, 53, w)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baselines.bin")
+            climatology.save(path)
+            print(f"  Saved {os.path.getsize(path)} bytes")
+            
+            mapped = Climatology.load(path, writable=True)
+            self.assertEqual(mapped.get_baseline(2, 53), climatology.get_baseline(2, 53))
+            mapped.update(1, 1, self.history[0])
+            mapped.save(path)  # saving back to the backing file must not truncate it
+            self.assertEqual(mapped.get_baseline(1, 1)[:2], (1, 70.0))
+            mapped.close()
+            
+            reread = Climatology.load(path)
+            self.assertEqual(reread.get_baseline(1, 1)[:2], (1, 70.0))
+            self.assertEqual(reread.get_baseline(2, 53), climatology.get_baseline(2, 53))
+            with self.assertRaises(ValueError, msg="Read-only baselines must not update"):
+                reread.update(1, 1, self.history[0])
+            reread.save(path)
+            self.assertEqual(reread.get_baseline(2, 53), climatology.get_baseline(2, 53))
+            
+            # Overwriting a different file that is itself mapped must not break its map
+            copy_path = os.path.join(tmp, "copy.bin")
+            climatology.save(copy_path)
+            copy = Climatology.load(copy_path)
+            reread.save(copy_path)
+            self.assertEqual(copy.get_baseline(2, 53), climatology.get_baseline(2, 53))
+            copy.close()
+            reread.close()
+            self.assertEqual(os.path.getsize(copy_path), os.path.getsize(path))
+            
+            # Right payload size for all three stations, header missing: must not load as garbage
+            bogus = os.path.join(tmp, "bogus.bin")
+            with open(bogus, 'wb') as f:
+                f.write(bytes(os.path.getsize(path) - 16))
+            with self.assertRaises(ValueError):
+                Climatology.load(bogus)
+            
+            with open(path, 'rb') as f:
+                data = bytearray(f.read())
+            data[5] ^= 1  # flip the byte-order flag
+            with open(bogus, 'wb') as f:
+                f.write(data)
+            with self.assertRaises(ValueError):
+                Climatology.load(bogus)
+        
+        print("  ✓ PASS: Memory-mapped baselines round-trip correctly")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
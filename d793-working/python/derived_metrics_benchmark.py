@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Throughput comparison of the lookup-table and formula paths for the
+batch wind chill and heat index calculations
+Western Governors University
+Created November 2025
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from weather import heat_index_fahrenheit, wind_chill_fahrenheit
+from weather_batch import WeatherBatch, _heat_index_table, _wind_chill_table
+
+
+def main(number_records: int = 200000):
+    """
+    Compute both derived metrics for random weeks through the lookup tables
+    and through the formulas, check they agree, and print the timings.
+    
+    Args:
+        number_records: Number of weekly records (7 station-days each)
+    """
+    rng = random.Random(0)
+    days = 7
+    batch = WeatherBatch([rng.randint(40, 120) for _ in range(number_records * days)],
+                         [rng.randint(-40, 60) for _ in range(number_records * days)],
+                         days, [rng.randint(0, 60) for _ in range(number_records)],
+                         "S" * number_records)
+    humidity = 55
+    
+    # Build the tables up front so only the per-value work is timed
+    _wind_chill_table()
+    _heat_index_table()
+    
+    def wind_chill_formula():
+        # Same per-day wind expansion as the table path, so only the
+        # per-value evaluation differs
+        return array('d', map(wind_chill_fahrenheit, batch._f_low_array,
+                              batch._repeat_per_day(batch._ws_mph)))
+    
+    def heat_index_formula():
+        return array('d', [heat_index_fahrenheit(t, humidity) for t in batch._f_high_array])
+    
+    cases = [
+        ("Wind chill", batch.calculate_daily_wind_chill, wind_chill_formula),
+        ("Heat index", lambda: batch.calculate_daily_heat_index(humidity), heat_index_formula),
+    ]
+    
+    print(f"Computing {number_records * days} station-days")
+    for name, table_path, formula_path in cases:
+        timings = []
+        results = []
+        for render in (table_path, formula_path):
+            start = time.perf_counter()
+            results.append(render())
+            timings.append(time.perf_counter() - start)
+        assert results[0] == results[1], f"{name}: table and formula disagree"
+        print(f"{name:<11} table {timings[0]:7.3f} s  formula {timings[1]:7.3f} s  "
+              f"speedup {timings[1] / timings[0]:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
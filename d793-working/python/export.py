@@ -0,0 +1,226 @@
+"""
+Export module for the Weather program
+Writes raw weather arrays and computed statistics as Apache Arrow record
+batches or JSON lines instead of console text
+Western Governors University
+Created November 2025
+"""
+
+import json
+from typing import IO, Iterator, Union
+
+from weather import Weather, WEATHER_CODE_DESCRIPTIONS
+from weather_batch import WeatherBatch
+
+
+# Records converted per chunk; bounds memory use on large outputs
+DEFAULT_CHUNK_RECORDS = 65536
+
+
+def _as_batch(source: Union[Weather, WeatherBatch]) -> WeatherBatch:
+    """
+    Return source as a WeatherBatch (a single Weather becomes one record).
+    
+    Args:
+        source: Weather object or WeatherBatch
+    
+    Returns:
+        WeatherBatch: Batch view of the source
+    """
+    if isinstance(source, Weather):
+        return WeatherBatch.from_weathers([source])
+    return source
+
+
+def _check_chunk_records(chunk_records: int) -> None:
+    """
+    Check that a chunk size is usable.
+    
+    Raises:
+        ValueError: If chunk_records is less than 1
+    """
+    if chunk_records < 1:
+        raise ValueError(f"chunk_records must be at least 1, got {chunk_records}")
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow, which is only needed for Arrow export.
+    
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow export requires the pyarrow package "
+                          "(pip install pyarrow)") from e
+    return pyarrow
+
+
+def _arrow_array(pa, values, arrow_type):
+    """
+    Wrap a typed array (or memoryview of one) as an Arrow array.
+    
+    The buffer is shared, not copied, when the item size matches the
+    Arrow type; the source array must not be resized while it is in use.
+    """
+    view = memoryview(values)
+    if view.itemsize * 8 != arrow_type.bit_width:
+        return pa.array(view.tolist(), type=arrow_type)
+    return pa.Array.from_buffers(arrow_type, len(view), [None, pa.py_buffer(view)])
+
+
+def arrow_schema(array_lengths: int = 7):
+    """
+    Return the Arrow schema used for exported weather records.
+    
+    Args:
+        array_lengths: Number of temperature readings per record
+    
+    Returns:
+        pyarrow.Schema: Export schema
+    """
+    pa = _import_pyarrow()
+    return pa.schema([
+        ("f_high", pa.list_(pa.int32(), array_lengths)),
+        ("f_low", pa.list_(pa.int32(), array_lengths)),
+        ("ws_mph", pa.int32()),
+        ("w_code", pa.string()),
+        ("description", pa.string()),
+        ("average_high", pa.float64()),
+        ("average_low", pa.float64()),
+        ("weekly_high", pa.int32()),
+        ("weekly_low", pa.int32()),
+    ])
+
+
+def iter_arrow_record_batches(source: Union[Weather, WeatherBatch],
+                              chunk_records: int = DEFAULT_CHUNK_RECORDS) -> Iterator:
+    """
+    Convert weather records to Arrow record batches, one chunk at a time.
+    
+    Temperature and wind speed columns share memory with the source arrays;
+    the computed statistics are built per chunk straight from those views.
+    
+    Args:
+        source: Weather object or WeatherBatch
+        chunk_records: Maximum records per record batch
+    
+    Returns:
+        Iterator[pyarrow.RecordBatch]: Records with the arrow_schema() columns
+    
+    Raises:
+        ValueError: If chunk_records is less than 1
+    """
+    _check_chunk_records(chunk_records)
+    pa = _import_pyarrow()
+    return _iter_arrow_record_batches(pa, _as_batch(source), chunk_records)
+
+
+def _iter_arrow_record_batches(pa, batch: WeatherBatch, chunk_records: int) -> Iterator:
+    """Yield the record batches for iter_arrow_record_batches, one chunk at a time."""
+    days = batch._number_temperatures
+    schema = arrow_schema(days)
+    highs = memoryview(batch._f_high_array)
+    lows = memoryview(batch._f_low_array)
+    winds = memoryview(batch._ws_mph)
+    
+    for start in range(0, len(batch), chunk_records):
+        stop = min(start + chunk_records, len(batch))
+        codes = batch._w_code[start:stop]
+        columns = [
+            pa.FixedSizeListArray.from_arrays(
+                _arrow_array(pa, highs[start * days:stop * days], pa.int32()), days),
+            pa.FixedSizeListArray.from_arrays(
+                _arrow_array(pa, lows[start * days:stop * days], pa.int32()), days),
+            _arrow_array(pa, winds[start:stop], pa.int32()),
+            pa.array(list(codes), type=pa.string()),
+            pa.array([WEATHER_CODE_DESCRIPTIONS.get(c, "UNKNOWN") for c in codes],
+                     type=pa.string()),
+            _arrow_array(pa, batch.calculate_average_fahrenheit_high_temp(start, stop), pa.float64()),
+            _arrow_array(pa, batch.calculate_average_fahrenheit_low_temp(start, stop), pa.float64()),
+            _arrow_array(pa, batch.find_weekly_fahrenheit_high_temp(start, stop), pa.int32()),
+            _arrow_array(pa, batch.find_weekly_fahrenheit_low_temp(start, stop), pa.int32()),
+        ]
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def write_arrow_stream(source: Union[Weather, WeatherBatch], sink,
+                       chunk_records: int = DEFAULT_CHUNK_RECORDS) -> int:
+    """
+    Write weather records in the Arrow IPC streaming format.
+    
+    Args:
+        source: Weather object or WeatherBatch
+        sink: File path, binary file object or pyarrow output stream
+        chunk_records: Maximum records per record batch
+    
+    Returns:
+        int: Number of records written
+    
+    Raises:
+        ValueError: If chunk_records is less than 1
+    """
+    _check_chunk_records(chunk_records)
+    pa = _import_pyarrow()
+    batch = _as_batch(source)
+    with pa.ipc.new_stream(sink, arrow_schema(batch._number_temperatures)) as writer:
+        for record_batch in iter_arrow_record_batches(batch, chunk_records):
+            writer.write_batch(record_batch)
+    return len(batch)
+
+
+def write_jsonl(source: Union[Weather, WeatherBatch], fp: IO[str],
+                chunk_records: int = DEFAULT_CHUNK_RECORDS) -> int:
+    """
+    Write weather records as JSON lines, one object per record.
+    
+    Output is produced chunk by chunk, so memory use is bounded by
+    chunk_records rather than by the size of the source.
+    
+    Args:
+        source: Weather object or WeatherBatch
+        fp: Text file object to write to
+        chunk_records: Records converted per chunk
+    
+    Returns:
+        int: Number of records written
+    
+    Raises:
+        ValueError: If chunk_records is less than 1
+    """
+    _check_chunk_records(chunk_records)
+    batch = _as_batch(source)
+    days = batch._number_temperatures
+    dumps = json.JSONEncoder(separators=(',', ':')).encode
+    highs_view = memoryview(batch._f_high_array)
+    lows_view = memoryview(batch._f_low_array)
+    winds_view = memoryview(batch._ws_mph)
+    
+    for start in range(0, len(batch), chunk_records):
+        stop = min(start + chunk_records, len(batch))
+        highs = highs_view[start * days:stop * days].tolist()
+        lows = lows_view[start * days:stop * days].tolist()
+        lines = [
+            dumps({
+                "f_high": highs[i * days:(i + 1) * days],
+                "f_low": lows[i * days:(i + 1) * days],
+                "ws_mph": ws,
+                "w_code": code,
+                "description": WEATHER_CODE_DESCRIPTIONS.get(code, "UNKNOWN"),
+                "average_high": avg_high,
+                "average_low": avg_low,
+                "weekly_high": weekly_high,
+                "weekly_low": weekly_low,
+            })
+            for i, (ws, code, avg_high, avg_low, weekly_high, weekly_low) in enumerate(zip(
+                winds_view[start:stop], batch._w_code[start:stop],
+                batch.calculate_average_fahrenheit_high_temp(start, stop),
+                batch.calculate_average_fahrenheit_low_temp(start, stop),
+                batch.find_weekly_fahrenheit_high_temp(start, stop),
+                batch.find_weekly_fahrenheit_low_temp(start, stop)))
+        ]
+        lines.append("")
+        fp.write("\n".join(lines))
+    return len(batch)
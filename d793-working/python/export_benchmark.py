@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Throughput comparison of the console text rendering and the structured
+export formats
+Western Governors University
+Created November 2025
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from export import write_arrow_stream, write_jsonl
+from weather import Weather
+from weather_batch import WeatherBatch
+
+
+def main(number_records: int = 100000):
+    """
+    Render the same random weeks as console text, JSON lines and Arrow,
+    and print the records per second of each.
+    
+    Args:
+        number_records: Number of weekly records to render
+    """
+    rng = random.Random(0)
+    weathers = [Weather([rng.randint(40, 100) for _ in range(7)],
+                        [rng.randint(0, 60) for _ in range(7)],
+                        7, rng.randint(0, 40), rng.choice("SPCN"))
+                for _ in range(number_records)]
+    batch = WeatherBatch.from_weathers(weathers)
+    
+    def text():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for w in weathers:
+                w.determine_description()
+                w.display_today_weather()
+                w.display_weekly_weather()
+    
+    def jsonl():
+        write_jsonl(batch, io.StringIO())
+    
+    def arrow():
+        write_arrow_stream(batch, io.BytesIO())
+    
+    print(f"Rendering {number_records} weekly records")
+    for name, render in [("Console text", text), ("JSON lines", jsonl), ("Arrow IPC", arrow)]:
+        try:
+            start = time.perf_counter()
+            render()
+            elapsed = time.perf_counter() - start
+        except ImportError as e:
+            print(f"{name:<13} skipped: {e}")
+            continue
+        print(f"{name:<13} {elapsed:8.3f} s  {number_records / elapsed:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
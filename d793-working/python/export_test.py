@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Export module
+Tests JSON-lines and Arrow output against the Weather statistics
+Western Governors University
+Created November 2025
+"""
+
+import io
+import json
+import unittest
+
+from export import iter_arrow_record_batches, write_arrow_stream, write_jsonl
+from weather import Weather
+from weather_batch import WeatherBatch
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestExport(unittest.TestCase):
+    """
+    Test Suite for the Export module
+    
+    Each test includes detailed output showing processing status and results.
+    """
+    
+    def setUp(self):
+        """
+        Set up three weekly records, including an unknown weather code.
+        """
+        print("\n" + "="*70)
+        self.weathers = [
+            Weather([78, 76, 80, 82, 85, 79, 75], [75, 70, 75, 76, 75, 70, 69], 7, 9, 'P'),
+            Weather([10, 5, 8, 12, 7, 9, 6], [-10, -15, -8, -5, -12, -9, -11], 7, 20, 'C'),
+            Weather([90] * 7, [65] * 7, 7, 0, 'X'),
+        ]
+        self.batch = WeatherBatch.from_weathers(self.weathers)
+    
+    def expected_record(self, w):
+        """Build the record a Weather object should export as."""
+        w.determine_description()
+        return {
+            "f_high": w._f_high_array,
+            "f_low": w._f_low_array,
+            "ws_mph": w._ws_mph,
+            "w_code": w._w_code,
+            "description": w._description,
+            "average_high": w.calculate_average_fahrenheit_high_temp(),
+            "average_low": w.calculate_average_fahrenheit_low_temp(),
+            "weekly_high": w.find_weekly_fahrenheit_high_temp(),
+            "weekly_low": w.find_weekly_fahrenheit_low_temp(),
+        }
+    
+    def test_1_jsonl_matches_weather_statistics(self):
+        """
+        Test 1: Verify JSON-Lines Output
+        
+        Every line must decode to the record's raw arrays and statistics,
+        regardless of how the output is chunked; chunk sizes below 1 are
+        rejected.
+        """
+        print("TEST 1: Processing JSON-lines export...")
+        
+        expected = [self.expected_record(w) for w in self.weathers]
+        for chunk_records in (1, 2, 1000):
+            out = io.StringIO()
+            written = write_jsonl(self.batch, out, chunk_records)
+            lines = out.getvalue().splitlines()
+            print(f"  Chunk Size {chunk_records}: {written} records, {len(lines)} lines")
+            self.assertEqual(written, 3)
+            self.assertEqual([json.loads(line) for line in lines], expected)
+        
+        single = io.StringIO()
+        write_jsonl(self.weathers[0], single)
+        self.assertEqual(json.loads(single.getvalue()), expected[0])
+        
+        for bad in (0, -1):
+            out = io.StringIO()
+            with self.assertRaises(ValueError):
+                write_jsonl(self.batch, out, bad)
+            self.assertEqual(out.getvalue(), "", msg="Nothing may be written for a bad chunk size")
+        
+        print("  ✓ PASS: JSON-lines export matches Weather statistics")
+    
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_2_arrow_matches_weather_statistics(self):
+        """
+        Test 2: Verify Arrow Output
+        
+        The Arrow IPC stream must round-trip to the same records, and the
+        temperature column must share memory with the batch array.
+        """
+        print("TEST 2: Processing Arrow export...")
+        
+        sink = pyarrow.BufferOutputStream()
+        written = write_arrow_stream(self.batch, sink, chunk_records=2)
+        table = pyarrow.ipc.open_stream(sink.getvalue()).read_all()
+        print(f"  Records: {written}, Record Batches: {len(table.to_batches())}")
+        
+        self.assertEqual(table.to_pylist(), [self.expected_record(w) for w in self.weathers])
+        
+        first = next(iter_arrow_record_batches(self.batch))
+        self.assertEqual(first.column(0).values.buffers()[1].address,
+                        self.batch._f_high_array.buffer_info()[0],
+                        msg="Temperature column should not be copied")
+        
+        for bad in (0, -1):
+            with self.assertRaises(ValueError):
+                iter_arrow_record_batches(self.batch, bad)
+            with self.assertRaises(ValueError):
+                write_arrow_stream(self.batch, pyarrow.BufferOutputStream(), bad)
+        
+        print("  ✓ PASS: Arrow export matches Weather statistics")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -8,6 +8,74 @@ Created November 2025
 from typing import List
 
 
+# Wind chill is only defined by the NWS for cold, windy conditions
+WIND_CHILL_MAX_TEMP_F = 50
+WIND_CHILL_MIN_WIND_MPH = 3
+
+# NWS rule: the simple Steadman estimate is used while its mean with the air
+# temperature is below this value; otherwise the Rothfusz regression applies
+HEAT_INDEX_MIN_TEMP_F = 80
+
+# Weather code to human-readable description
+WEATHER_CODE_DESCRIPTIONS = {
+    'S': "SUNNY",
+    'P': "PARTLY CLOUDY",
+    'C': "CLOUDY",
+    'N': "CLEAR"
+}
+
+
+def wind_chill_fahrenheit(temp_f: float, ws_mph: float) -> float:
+    """
+    Compute the NWS (2001) wind chill temperature.
+    
+    Outside the formula's valid range (temperature above 50 F or wind
+    below 3 mph) the air temperature is returned unchanged.
+    
+    Args:
+        temp_f: Air temperature in Fahrenheit
+        ws_mph: Wind speed in miles per hour
+    
+    Returns:
+        float: Wind chill temperature in Fahrenheit
+    """
+    if temp_f > WIND_CHILL_MAX_TEMP_F or ws_mph < WIND_CHILL_MIN_WIND_MPH:
+        return float(temp_f)
+    v016 = ws_mph ** 0.16
+    return 35.74 + 0.6215 * temp_f - 35.75 * v016 + 0.4275 * temp_f * v016
+
+
+def heat_index_fahrenheit(temp_f: float, relative_humidity: float) -> float:
+    """
+    Compute the NWS heat index (Rothfusz regression with adjustments).
+    
+    Follows the NWS algorithm: the simple Steadman estimate is used while
+    its mean with the air temperature is below 80 F, and the full
+    regression otherwise.
+    
+    Args:
+        temp_f: Air temperature in Fahrenheit
+        relative_humidity: Relative humidity in percent (0-100)
+    
+    Returns:
+        float: Heat index in Fahrenheit
+    """
+    t = temp_f
+    rh = relative_humidity
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+    if (simple + t) / 2.0 < HEAT_INDEX_MIN_TEMP_F:
+        return simple
+    hi = (-42.379 + 2.04901523 * t + 10.14333127 * rh
+          - 0.22475541 * t * rh - 0.00683783 * t * t
+          - 0.05481717 * rh * rh + 0.00122874 * t * t * rh
+          + 0.00085282 * t * rh * rh - 0.00000199 * t * t * rh * rh)
+    if rh < 13 and 80 <= t <= 112:
+        hi -= ((13 - rh) / 4.0) * ((17 - abs(t - 95.0)) / 17.0) ** 0.5
+    elif rh > 85 and 80 <= t <= 87:
+        hi += ((rh - 85) / 10.0) * ((87 - t) / 5.0)
+    return hi
+
+
 class Weather:
     """
     Weather class to store and analyze weekly weather data.
@@ -114,6 +182,34 @@ class Weather:
         return lowest_temp
         # Alternative Pythonic way: return min(self._f_low_array)
     
+    def calculate_daily_wind_chill(self) -> List[float]:
+        """
+        Calculate the wind chill for each day of the week.
+        
+        Uses each day's low temperature with the weekly wind speed.
+        
+        Returns:
+            List[float]: Wind chill in Fahrenheit, one value per day
+        """
+        return [wind_chill_fahrenheit(temp, self._ws_mph)
+                for temp in self._f_low_array[:self._number_temperatures]]
+    
+    def calculate_daily_heat_index(self, relative_humidity: float) -> List[float]:
+        """
+        Calculate the heat index for each day of the week.
+        
+        Uses each day's high temperature. Humidity is not part of the
+        weekly data, so it must be supplied by the caller.
+        
+        Args:
+            relative_humidity: Relative humidity in percent (0-100)
+        
+        Returns:
+            List[float]: Heat index in Fahrenheit, one value per day
+        """
+        return [heat_index_fahrenheit(temp, relative_humidity)
+                for temp in self._f_high_array[:self._number_temperatures]]
+    
     def determine_description(self) -> None:
         """
         Determine the weather description based on the weather code.
@@ -125,13 +221,7 @@ class Weather:
             'N' -> "CLEAR"
         """
         # Dictionary mapping (more Pythonic than if-elif)
-        code_map = {
-            'S': "SUNNY",
-            'P': "PARTLY CLOUDY",
-            'C': "CLOUDY",
-            'N': "CLEAR"
-        }
-        self._description = code_map.get(self._w_code, "UNKNOWN")
+        self._description = WEATHER_CODE_DESCRIPTIONS.get(self._w_code, "UNKNOWN")
     
     def display_today_weather(self) -> None:
         """
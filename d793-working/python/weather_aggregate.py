@@ -0,0 +1,287 @@
+"""
+Aggregate weather module for the Weather program
+Mergeable partial statistics for splitting aggregation across machines
+Western Governors University
+Created November 2025
+"""
+
+import struct
+from typing import Dict, Iterable, Optional
+
+from weather import Weather
+from weather_batch import WeatherBatch
+
+
+# Binary layout: magic, version, then the fixed fields and the code histogram
+_MAGIC = b'WAGG'
+_VERSION = 1
+_HEADER = struct.Struct('<4sB')
+_FIELDS = struct.Struct('<qqqqqqqq')
+_CODE_COUNT = struct.Struct('<H')
+_CODE_ENTRY = struct.Struct('<Bq')
+
+
+class WeatherAggregate:
+    """
+    Partial weather statistics for any subset of weekly records.
+    
+    Aggregates built on different machines can be merged in any order and
+    grouping; the result gives the same averages and extremes as the Weather
+    statistics over all of the readings combined. Sums are kept as exact
+    integers so merging is associative and commutative.
+    
+    Attributes:
+        _record_count (int): Number of weekly records
+        _number_temperatures (int): Total number of daily readings
+        _f_high_sum (int): Sum of all high temperatures
+        _f_low_sum (int): Sum of all low temperatures
+        _f_high_max (Optional[int]): Highest high temperature (None if empty)
+        _f_high_min (Optional[int]): Lowest high temperature (None if empty)
+        _f_low_max (Optional[int]): Highest low temperature (None if empty)
+        _f_low_min (Optional[int]): Lowest low temperature (None if empty)
+        _w_code_counts (Dict[str, int]): Number of records per weather code
+    """
+    
+    def __init__(self):
+        """
+        Initialize an empty aggregate (the identity for merge).
+        """
+        self._record_count: int = 0
+        self._number_temperatures: int = 0
+        self._f_high_sum: int = 0
+        self._f_low_sum: int = 0
+        self._f_high_max: Optional[int] = None
+        self._f_high_min: Optional[int] = None
+        self._f_low_max: Optional[int] = None
+        self._f_low_min: Optional[int] = None
+        self._w_code_counts: Dict[str, int] = {}
+    
+    @classmethod
+    def _from_columns(cls, highs, lows, record_count: int, codes: Iterable[str]) -> "WeatherAggregate":
+        """Build an aggregate from flat high/low readings and weather codes."""
+        aggregate = cls()
+        if record_count == 0:
+            return aggregate
+        aggregate._record_count = record_count
+        aggregate._number_temperatures = len(highs)
+        aggregate._f_high_sum = sum(highs)
+        aggregate._f_low_sum = sum(lows)
+        aggregate._f_high_max = max(highs)
+        aggregate._f_high_min = min(highs)
+        aggregate._f_low_max = max(lows)
+        aggregate._f_low_min = min(lows)
+        for code in codes:
+            aggregate._w_code_counts[code] = aggregate._w_code_counts.get(code, 0) + 1
+        return aggregate
+    
+    @classmethod
+    def from_weather(cls, weather: Weather) -> "WeatherAggregate":
+        """
+        Build an aggregate of one Weather record.
+        
+        Args:
+            weather: Weekly record
+        
+        Returns:
+            WeatherAggregate: Aggregate of the record's readings
+        """
+        n = weather._number_temperatures
+        return cls._from_columns(weather._f_high_array[:n], weather._f_low_array[:n],
+                                 1, [weather._w_code])
+    
+    @classmethod
+    def from_batch(cls, batch: WeatherBatch) -> "WeatherAggregate":
+        """
+        Build an aggregate of every record in a batch.
+        
+        Args:
+            batch: Weekly records
+        
+        Returns:
+            WeatherAggregate: Aggregate of all the batch's readings
+        """
+        return cls._from_columns(batch._f_high_array, batch._f_low_array,
+                                 len(batch), batch._w_code)
+    
+    def merge(self, other: "WeatherAggregate") -> "WeatherAggregate":
+        """
+        Combine two aggregates into a new one; neither input is changed.
+        
+        Args:
+            other: Aggregate of a disjoint set of records
+        
+        Returns:
+            WeatherAggregate: Aggregate of both sets of records
+        """
+        if other._record_count == 0:
+            return self._copy()
+        if self._record_count == 0:
+            return other._copy()
+        
+        merged = WeatherAggregate()
+        merged._record_count = self._record_count + other._record_count
+        merged._number_temperatures = self._number_temperatures + other._number_temperatures
+        merged._f_high_sum = self._f_high_sum + other._f_high_sum
+        merged._f_low_sum = self._f_low_sum + other._f_low_sum
+        merged._f_high_max = max(self._f_high_max, other._f_high_max)
+        merged._f_high_min = min(self._f_high_min, other._f_high_min)
+        merged._f_low_max = max(self._f_low_max, other._f_low_max)
+        merged._f_low_min = min(self._f_low_min, other._f_low_min)
+        merged._w_code_counts = dict(self._w_code_counts)
+        for code, count in other._w_code_counts.items():
+            merged._w_code_counts[code] = merged._w_code_counts.get(code, 0) + count
+        return merged
+    
+    def __add__(self, other: "WeatherAggregate") -> "WeatherAggregate":
+        """Merge with the + operator, so sum(aggregates, WeatherAggregate()) works."""
+        return self.merge(other)
+    
+    def __eq__(self, other) -> bool:
+        """Two aggregates are equal when all their statistics are equal."""
+        if not isinstance(other, WeatherAggregate):
+            return NotImplemented
+        return vars(self) == vars(other)
+    
+    def _copy(self) -> "WeatherAggregate":
+        """Return an independent copy of this aggregate."""
+        copy = WeatherAggregate()
+        copy.__dict__.update(vars(self))
+        copy._w_code_counts = dict(self._w_code_counts)
+        return copy
+    
+    def _require_records(self) -> None:
+        """
+        Check that the aggregate holds at least one record.
+        
+        Raises:
+            ValueError: If the aggregate holds no records
+        """
+        if self._record_count == 0:
+            raise ValueError("WeatherAggregate is empty")
+    
+    def calculate_average_fahrenheit_high_temp(self) -> float:
+        """
+        Calculate the average of all high temperatures.
+        
+        Returns:
+            float: Average high temperature
+        """
+        self._require_records()
+        return self._f_high_sum / self._number_temperatures
+    
+    def calculate_average_fahrenheit_low_temp(self) -> float:
+        """
+        Calculate the average of all low temperatures.
+        
+        Returns:
+            float: Average low temperature
+        """
+        self._require_records()
+        return self._f_low_sum / self._number_temperatures
+    
+    def find_weekly_fahrenheit_high_temp(self) -> int:
+        """
+        Find the highest high temperature.
+        
+        Returns:
+            int: Highest temperature value
+        """
+        self._require_records()
+        return self._f_high_max
+    
+    def find_weekly_fahrenheit_low_temp(self) -> int:
+        """
+        Find the lowest low temperature.
+        
+        Returns:
+            int: Lowest temperature value
+        """
+        self._require_records()
+        return self._f_low_min
+    
+    def get_code_counts(self) -> Dict[str, int]:
+        """
+        Return the number of records per weather code.
+        
+        Returns:
+            Dict[str, int]: Copy of the weather code histogram
+        """
+        return dict(self._w_code_counts)
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to the compact, versioned binary form.
+        
+        Codes are written in sorted order, so equal aggregates always
+        serialize to equal bytes.
+        
+        Returns:
+            bytes: Serialized aggregate
+        
+        Raises:
+            ValueError: If a value does not fit the binary layout
+        """
+        empty = self._record_count == 0
+        try:
+            parts = [
+                _HEADER.pack(_MAGIC, _VERSION),
+                _FIELDS.pack(self._record_count, self._number_temperatures,
+                             self._f_high_sum, self._f_low_sum,
+                             0 if empty else self._f_high_max, 0 if empty else self._f_high_min,
+                             0 if empty else self._f_low_max, 0 if empty else self._f_low_min),
+                _CODE_COUNT.pack(len(self._w_code_counts)),
+            ]
+            for code in sorted(self._w_code_counts):
+                encoded = code.encode('utf-8')
+                parts.append(_CODE_ENTRY.pack(len(encoded), self._w_code_counts[code]))
+                parts.append(encoded)
+        except struct.error as e:
+            raise ValueError(f"WeatherAggregate cannot be serialized: {e}") from e
+        return b''.join(parts)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WeatherAggregate":
+        """
+        Deserialize an aggregate written by to_bytes().
+        
+        Args:
+            data: Serialized aggregate
+        
+        Returns:
+            WeatherAggregate: The deserialized aggregate
+        
+        Raises:
+            ValueError: If the data is not a supported aggregate
+        """
+        try:
+            magic, version = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC:
+                raise ValueError("Data is not a serialized WeatherAggregate")
+            if version != _VERSION:
+                raise ValueError(f"Unsupported WeatherAggregate version {version}")
+            offset = _HEADER.size
+            
+            fields = _FIELDS.unpack_from(data, offset)
+            offset += _FIELDS.size
+            (code_entries,) = _CODE_COUNT.unpack_from(data, offset)
+            offset += _CODE_COUNT.size
+            
+            aggregate = cls()
+            (aggregate._record_count, aggregate._number_temperatures,
+             aggregate._f_high_sum, aggregate._f_low_sum) = fields[:4]
+            if aggregate._record_count:
+                (aggregate._f_high_max, aggregate._f_high_min,
+                 aggregate._f_low_max, aggregate._f_low_min) = fields[4:8]
+            for _ in range(code_entries):
+                length, count = _CODE_ENTRY.unpack_from(data, offset)
+                offset += _CODE_ENTRY.size
+                if offset + length > len(data):
+                    raise struct.error("code extends past end of data")
+                code = bytes(data[offset:offset + length]).decode('utf-8')
+                offset += length
+                aggregate._w_code_counts[code] = count
+        except struct.error as e:
+            raise ValueError("Truncated WeatherAggregate data") from e
+        if offset != len(data):
+            raise ValueError("Trailing bytes after WeatherAggregate data")
+        return aggregate
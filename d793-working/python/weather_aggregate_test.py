@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the WeatherAggregate module
+Tests merging, serialization and multi-process aggregation
+Western Governors University
+Created November 2025
+"""
+
+import itertools
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+from weather import Weather
+from weather_aggregate import WeatherAggregate
+from weather_batch import WeatherBatch
+
+
+def make_weeks():
+    """
+    Build twelve weekly records with varied temperatures and codes.
+    """
+    return [Weather([60 + (i * 7 + d) % 41 for d in range(7)],
+                    [-20 + (i * 5 + d * 3) % 50 for d in range(7)],
+                    7, i % 30, "SPCN"[i % 4])
+            for i in range(12)]
+
+
+def aggregate_node(node: int, nodes: int) -> bytes:
+    """
+    Aggregate one node's share of the records, as a separate process would.
+    
+    Args:
+        node: Index of this node
+        nodes: Total number of nodes
+    
+    Returns:
+        bytes: Serialized partial aggregate
+    """
+    batch = WeatherBatch.from_weathers(make_weeks()[node::nodes])
+    return WeatherAggregate.from_batch(batch).to_bytes()
+
+
+class TestWeatherAggregate(unittest.TestCase):
+    """
+    Test Suite for the WeatherAggregate module
+    
+    Each test includes detailed output showing processing status and results.
+    """
+    
+    def setUp(self):
+        """
+        Set up the records and a single Weather holding all of their readings.
+        """
+        print("\n" + "="*70)
+        self.weeks = make_weeks()
+        highs = [t for w in self.weeks for t in w._f_high_array]
+        lows = [t for w in self.weeks for t in w._f_low_array]
+        self.combined = Weather(highs, lows, len(highs), 0, 'S')
+    
+    def assert_matches_combined(self, aggregate):
+        """Check an aggregate against the Weather statistics over all readings."""
+        self.assertEqual(aggregate.calculate_average_fahrenheit_high_temp(),
+                        self.combined.calculate_average_fahrenheit_high_temp())
+        self.assertEqual(aggregate.calculate_average_fahrenheit_low_temp(),
+                        self.combined.calculate_average_fahrenheit_low_temp())
+        self.assertEqual(aggregate.find_weekly_fahrenheit_high_temp(),
+                        self.combined.find_weekly_fahrenheit_high_temp())
+        self.assertEqual(aggregate.find_weekly_fahrenheit_low_temp(),
+                        self.combined.find_weekly_fahrenheit_low_temp())
+        self.assertEqual(aggregate.get_code_counts(), {'S': 3, 'P': 3, 'C': 3, 'N': 3})
+    
+    def test_1_merge_is_associative_and_commutative(self):
+        """
+        Test 1: Verify Merge Order Does Not Matter
+        
+        Per-record aggregates merged in every order of four groups, and with
+        empty aggregates mixed in, must all equal the same result.
+        """
+        print("TEST 1: Processing aggregate merging...")
+        
+        parts = [WeatherAggregate.from_weather(w) for w in self.weeks]
+        groups = [reduce(WeatherAggregate.merge, parts[i:i + 3]) for i in range(0, 12, 3)]
+        expected = sum(parts, WeatherAggregate())
+        
+        for order in itertools.permutations(groups):
+            self.assertEqual(reduce(WeatherAggregate.merge, order), expected)
+        self.assertEqual(groups[0].merge(groups[1]).merge(groups[2]),
+                        groups[0].merge(groups[1].merge(groups[2])))
+        self.assertEqual(WeatherAggregate().merge(expected), expected)
+        self.assertEqual(WeatherAggregate.from_batch(WeatherBatch.from_weathers(self.weeks)),
+                        expected)
+        print(f"  Records: {expected._record_count}, Readings: {expected._number_temperatures}")
+        
+        self.assert_matches_combined(expected)
+        for code in ('', 'SP'):
+            single = WeatherAggregate.from_weather(Weather([70] * 7, [50] * 7, 7, 0, code))
+            self.assertEqual(single.get_code_counts(), {code: 1},
+                            msg="Each record must count once under its whole code")
+        
+        print("  ✓ PASS: Merge is associative and commutative")
+    
+    def test_2_binary_round_trip(self):
+        """
+        Test 2: Verify the Versioned Binary Form
+        
+        Aggregates (including the empty one and values beyond 32 bits) must
+        round-trip through bytes. Bad magic, versions or truncated data, and
+        values too large to serialize, must raise ValueError.
+        """
+        print("TEST 2: Processing binary serialization...")
+        
+        aggregate = WeatherAggregate.from_batch(WeatherBatch.from_weathers(self.weeks))
+        data = aggregate.to_bytes()
+        print(f"  Serialized Size: {len(data)} bytes")
+        
+        self.assertEqual(WeatherAggregate.from_bytes(data), aggregate)
+        self.assertEqual(WeatherAggregate.from_bytes(WeatherAggregate().to_bytes()),
+                        WeatherAggregate())
+        for bad in (b'XXXX' + data[4:], data[:4] + b'\x63' + data[5:], data[:-1], data + b'\x00'):
+            with self.assertRaises(ValueError):
+                WeatherAggregate.from_bytes(bad)
+        with self.assertRaises(ValueError):
+            WeatherAggregate().calculate_average_fahrenheit_high_temp()
+        
+        wide = WeatherAggregate.from_weather(Weather([2 ** 40] * 7, [-2 ** 40] * 7, 7, 0, 'S'))
+        self.assertEqual(WeatherAggregate.from_bytes(wide.to_bytes()), wide)
+        with self.assertRaises(ValueError):
+            WeatherAggregate.from_weather(Weather([2 ** 70] * 7, [0] * 7, 7, 0, 'S')).to_bytes()
+        
+        print("  ✓ PASS: Binary form round-trips and rejects bad data")
+    
+    def test_3_multi_process_aggregation(self):
+        """
+        Test 3: Verify Aggregation Split Across Processes
+        
+        Three worker processes stand in for nodes; their serialized partial
+        aggregates are merged and compared with the single-object statistics.
+        """
+        print("TEST 3: Processing multi-process aggregation...")
+        
+        nodes = 3
+        with ProcessPoolExecutor(max_workers=nodes) as pool:
+            partials = list(pool.map(aggregate_node, range(nodes), [nodes] * nodes))
+        print(f"  Partial Sizes: {[len(p) for p in partials]} bytes")
+        
+        merged = reduce(WeatherAggregate.merge,
+                        (WeatherAggregate.from_bytes(p) for p in reversed(partials)))
+        
+        self.assert_matches_combined(merged)
+        print("  ✓ PASS: Multi-process aggregation matches combined statistics")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
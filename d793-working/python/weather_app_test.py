@@ -8,6 +8,7 @@ Created November 2025
 
 import unittest
 from weather import Weather
+from weather_batch import WeatherBatch
 
 
 class TestWeatherProgram(unittest.TestCase):
@@ -252,6 +253,71 @@ class TestWeatherProgram(unittest.TestCase):
                         msg="Weather object was affected by external array modification (lows)")
         
         print("  ✓ PASS: Data isolation maintained - Weather object unaffected by external changes")
+    
+    def test_6_wind_chill_and_heat_index(self):
+        """
+        Test 6: Verify Derived Wind Chill and Heat Index Metrics
+        
+        This test checks the daily derived metrics against published
+        NWS chart values:
+        - Wind chill at 0°F with 15 mph wind is -19°F
+        - Heat index at 96°F with 65% humidity is 121°F
+        - Wind chill is the air temperature above 50°F or below 3 mph wind
+        """
+        print("TEST 6: Processing wind chill and heat index calculations...")
+        
+        cold = Weather([10] * 7, [0, 0, 0, 0, 0, 0, 60], 7, 15, 'C')
+        chills = cold.calculate_daily_wind_chill()
+        print(f"  Wind Chill (0°F, 15 mph): {chills[0]:.2f}°F")
+        
+        hot = Weather([96] * 7, [80] * 7, 7, 5, 'S')
+        indexes = hot.calculate_daily_heat_index(65)
+        print(f"  Heat Index (96°F, 65%): {indexes[0]:.2f}°F")
+        
+        calm = Weather([10] * 7, [5] * 7, 7, 2, 'N')
+        
+        self.assertEqual(len(chills), 7)
+        self.assertEqual(round(chills[0]), -19,
+                        msg="Wind chill does not match the NWS chart")
+        self.assertEqual(chills[6], 60.0,
+                        msg="Wind chill above 50°F should equal the air temperature")
+        self.assertEqual(calm.calculate_daily_wind_chill(), [5.0] * 7,
+                        msg="Wind chill below 3 mph should equal the air temperature")
+        self.assertEqual(round(indexes[0]), 121,
+                        msg="Heat index does not match the NWS chart")
+        
+        print("  ✓ PASS: Derived metrics match NWS reference values")
+    
+    def test_7_batch_derived_metrics_match_weather(self):
+        """
+        Test 7: Verify Batch Derived Metrics Match Per-Object Results
+        
+        This test builds a WeatherBatch from several Weather objects,
+        including values outside the lookup table grid, and confirms the
+        batch results equal the per-object methods day for day.
+        """
+        print("TEST 7: Processing batch derived metric calculations...")
+        
+        weathers = [
+            Weather(self.highs, self.lows, 7, 10, 'S'),
+            Weather([10, 5, 8, 12, 7, 9, 6], [-10, -15, -8, -5, -12, -9, -11], 7, 20, 'C'),
+            Weather([150, 85, 90, 95, 100, 105, 110], [-90, 30, 40, 50, 60, 70, 80], 7, 130, 'P'),
+        ]
+        batch = WeatherBatch.from_weathers(weathers)
+        print(f"  Batch Records: {len(batch)}")
+        
+        expected_chill = [c for w in weathers for c in w.calculate_daily_wind_chill()]
+        expected_heat = [h for w in weathers for h in w.calculate_daily_heat_index(40)]
+        
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(list(batch.calculate_daily_wind_chill()), expected_chill,
+                        msg="Batch wind chill differs from Weather results")
+        self.assertEqual(list(batch.calculate_daily_heat_index(40)), expected_heat,
+                        msg="Batch heat index differs from Weather results")
+        self.assertEqual(list(batch.calculate_daily_heat_index([40] * 21)), expected_heat,
+                        msg="Per-day humidity heat index differs from Weather results")
+        
+        print("  ✓ PASS: Batch derived metrics match per-object results")
 
 
 def run_tests():
@@ -266,10 +332,11 @@ def run_tests():
     print("\n" + "="*70)
     print("WEATHER PROGRAM - UNIT TEST SUITE")
     print("="*70)
-    print("Running 5 comprehensive tests covering:")
+    print("Running 7 comprehensive tests covering:")
     print("  • Core temperature calculation functionality")
     print("  • Edge cases with extreme values")
     print("  • Data integrity and isolation")
+    print("  • Derived wind chill and heat index metrics")
     print("="*70)
     
     # Create test suite
@@ -0,0 +1,307 @@
+"""
+Batch (columnar) weather module for the Weather program
+Stores many weekly Weather records in flat typed arrays
+Western Governors University
+Created November 2025
+"""
+
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from operator import add, truediv
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from weather import Weather, heat_index_fahrenheit, wind_chill_fahrenheit
+
+
+# Integer grid covered by the wind chill lookup table
+# (above WIND_CHILL_MAX_TEMP_F the entries are simply the air temperature,
+# so whole batches can be served from the table without a branch)
+_WC_TEMP_MIN = -80
+_WC_TEMP_MAX = 140
+_WC_WIND_MAX = 120
+_WC_SPAN = _WC_TEMP_MAX - _WC_TEMP_MIN + 1
+
+# Integer grid covered by the heat index lookup table
+_HI_TEMP_MIN = -80
+_HI_TEMP_MAX = 140
+_HI_RH_MAX = 100
+_HI_SPAN = _HI_TEMP_MAX - _HI_TEMP_MIN + 1
+
+
+@lru_cache(maxsize=None)
+def _wind_chill_table() -> array:
+    """
+    Build the wind chill lookup table (built once, on first use).
+    
+    Rows are wind speeds 0.._WC_WIND_MAX mph, columns are temperatures
+    _WC_TEMP_MIN.._WC_TEMP_MAX F, so one wind speed is a contiguous row.
+    
+    Returns:
+        array: Flat array of doubles
+    """
+    return array('d', (wind_chill_fahrenheit(t, v)
+                       for v in range(_WC_WIND_MAX + 1)
+                       for t in range(_WC_TEMP_MIN, _WC_TEMP_MAX + 1)))
+
+
+@lru_cache(maxsize=None)
+def _heat_index_table() -> array:
+    """
+    Build the heat index lookup table (built once, on first use).
+    
+    Rows are relative humidities 0.._HI_RH_MAX percent, columns are
+    temperatures _HI_TEMP_MIN.._HI_TEMP_MAX F.
+    
+    Returns:
+        array: Flat array of doubles
+    """
+    return array('d', (heat_index_fahrenheit(t, rh)
+                       for rh in range(_HI_RH_MAX + 1)
+                       for t in range(_HI_TEMP_MIN, _HI_TEMP_MAX + 1)))
+
+
+class WeatherBatch:
+    """
+    Columnar container for many weekly Weather records.
+    
+    Record i occupies elements [i * days, (i + 1) * days) of the
+    temperature arrays and element i of the wind speed and weather code
+    columns. Derived metrics are computed over the whole batch in one pass.
+    
+    Attributes:
+        _f_high_array (array): Flat array of daily high temperatures
+        _f_low_array (array): Flat array of daily low temperatures
+        _ws_mph (array): Wind speed in miles per hour, one per record
+        _number_temperatures (int): Number of readings per record (7 for weekly)
+        _w_code (str): Weather codes, one character per record
+    """
+    
+    def __init__(self, fh_array: Iterable[int], fl_array: Iterable[int],
+                 array_lengths: int, ws: Iterable[int], wc: str):
+        """
+        Initialize WeatherBatch from flat column data.
+        
+        Args:
+            fh_array: Flat high temperatures, array_lengths per record
+            fl_array: Flat low temperatures, array_lengths per record
+            array_lengths: Number of temperature readings per record
+            ws: Wind speeds, one per record
+            wc: Weather codes, one character per record
+        
+        Raises:
+            ValueError: If the column lengths do not agree
+        """
+        self._f_high_array: array = array('i', fh_array)
+        self._f_low_array: array = array('i', fl_array)
+        self._ws_mph: array = array('i', ws)
+        self._number_temperatures: int = array_lengths
+        self._w_code: str = wc
+        
+        count = len(self._ws_mph)
+        expected = count * array_lengths
+        if (len(self._f_high_array) != expected
+                or len(self._f_low_array) != expected
+                or len(self._w_code) != count):
+            raise ValueError("WeatherBatch columns have inconsistent lengths")
+    
+    @classmethod
+    def from_weathers(cls, weathers: Iterable[Weather]) -> "WeatherBatch":
+        """
+        Build a batch from individual Weather objects.
+        
+        Args:
+            weathers: Weather objects, all with the same number of readings
+        
+        Returns:
+            WeatherBatch: New batch holding a copy of the data
+        
+        Raises:
+            ValueError: If the objects have differing numbers of readings
+        """
+        highs = array('i')
+        lows = array('i')
+        winds = array('i')
+        codes = []
+        days = None
+        for w in weathers:
+            n = w._number_temperatures
+            if days is None:
+                days = n
+            elif n != days:
+                raise ValueError("All Weather records must have the same number of readings")
+            highs.extend(w._f_high_array[:n])
+            lows.extend(w._f_low_array[:n])
+            winds.append(w._ws_mph)
+            codes.append(w._w_code)
+        return cls(highs, lows, days if days is not None else 7, winds, "".join(codes))
+    
+    def __len__(self) -> int:
+        """Return the number of records in the batch."""
+        return len(self._ws_mph)
+    
+    def _per_record(self, values: array, start: int = 0,
+                    stop: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Group a flat temperature column into one tuple per record.
+        
+        The record range is taken as a memoryview, so nothing is copied, and
+        zipping one shared iterator with itself yields consecutive groups
+        without allocating a slice per record.
+        
+        Args:
+            values: Flat column aligned with the temperature arrays
+            start: First record index
+            stop: One past the last record index (default: end of the batch)
+        
+        Returns:
+            Iterator[Tuple[int, ...]]: The readings of each record in turn
+        """
+        days = self._number_temperatures
+        if stop is None:
+            stop = len(self)
+        view = memoryview(values)[start * days:stop * days]
+        return zip(*[iter(view)] * days)
+    
+    def _repeat_per_day(self, values: array) -> array:
+        """
+        Expand a per-record column so it lines up with the temperature arrays.
+        
+        Filled with one strided slice assignment per day of the week, which
+        avoids a Python-level loop over the records.
+        
+        Args:
+            values: Typed array with one value per record
+        
+        Returns:
+            array: Array of the same type with each value repeated per day
+        """
+        days = self._number_temperatures
+        out = array(values.typecode, bytes(len(values) * days * values.itemsize))
+        for day in range(days):
+            out[day::days] = values
+        return out
+    
+    def calculate_average_fahrenheit_high_temp(self, start: int = 0, stop: Optional[int] = None) -> array:
+        """
+        Calculate the average high temperature of every record in a range.
+        
+        Args:
+            start: First record index
+            stop: One past the last record index (default: end of the batch)
+        
+        Returns:
+            array: Average high per record, as doubles
+        """
+        return array('d', map(truediv, map(sum, self._per_record(self._f_high_array, start, stop)),
+                              repeat(self._number_temperatures)))
+    
+    def calculate_average_fahrenheit_low_temp(self, start: int = 0, stop: Optional[int] = None) -> array:
+        """
+        Calculate the average low temperature of every record in a range.
+        
+        Args:
+            start: First record index
+            stop: One past the last record index (default: end of the batch)
+        
+        Returns:
+            array: Average low per record, as doubles
+        """
+        return array('d', map(truediv, map(sum, self._per_record(self._f_low_array, start, stop)),
+                              repeat(self._number_temperatures)))
+    
+    def find_weekly_fahrenheit_high_temp(self, start: int = 0, stop: Optional[int] = None) -> array:
+        """
+        Find the highest temperature of every record in a range.
+        
+        Args:
+            start: First record index
+            stop: One past the last record index (default: end of the batch)
+        
+        Returns:
+            array: Highest high per record
+        """
+        return array('i', map(max, self._per_record(self._f_high_array, start, stop)))
+    
+    def find_weekly_fahrenheit_low_temp(self, start: int = 0, stop: Optional[int] = None) -> array:
+        """
+        Find the lowest temperature of every record in a range.
+        
+        Args:
+            start: First record index
+            stop: One past the last record index (default: end of the batch)
+        
+        Returns:
+            array: Lowest low per record
+        """
+        return array('i', map(min, self._per_record(self._f_low_array, start, stop)))
+    
+    def calculate_daily_wind_chill(self) -> array:
+        """
+        Calculate the wind chill for every record-day in the batch.
+        
+        Uses each day's low temperature with the record's wind speed,
+        matching Weather.calculate_daily_wind_chill. Values on the integer
+        lookup grid are read from the table; anything else falls back to
+        the formula.
+        
+        Returns:
+            array: Flat array of doubles, aligned with the temperature arrays
+        """
+        lows = self._f_low_array
+        winds = self._ws_mph
+        if not winds:
+            return array('d')
+        table = _wind_chill_table()
+        
+        # Start of each record's table row, lined up with its days
+        offsets = self._repeat_per_day(
+            array('i', [v * _WC_SPAN - _WC_TEMP_MIN for v in winds]))
+        if (_WC_TEMP_MIN <= min(lows) and max(lows) <= _WC_TEMP_MAX
+                and 0 <= min(winds) and max(winds) <= _WC_WIND_MAX):
+            return array('d', map(table.__getitem__, map(add, offsets, lows)))
+        
+        ws_per_day = self._repeat_per_day(winds)
+        return array('d', [
+            table[base + t]
+            if (_WC_TEMP_MIN <= t <= _WC_TEMP_MAX and 0 <= v <= _WC_WIND_MAX)
+            else wind_chill_fahrenheit(t, v)
+            for base, t, v in zip(offsets, lows, ws_per_day)])
+    
+    def calculate_daily_heat_index(self, relative_humidity: Union[int, float, Sequence[float]]) -> array:
+        """
+        Calculate the heat index for every record-day in the batch.
+        
+        Uses each day's high temperature, matching
+        Weather.calculate_daily_heat_index. Integer humidities on the lookup
+        grid are read from the table; anything else falls back to the formula.
+        
+        Args:
+            relative_humidity: One humidity for the whole batch, or one per
+                record-day aligned with the temperature arrays
+        
+        Returns:
+            array: Flat array of doubles, aligned with the temperature arrays
+        
+        Raises:
+            ValueError: If a humidity sequence has the wrong length
+        """
+        highs = self._f_high_array
+        table = _heat_index_table()
+        
+        if isinstance(relative_humidity, (int, float)):
+            rh = relative_humidity
+            if isinstance(rh, int) and 0 <= rh <= _HI_RH_MAX:
+                base = rh * _HI_SPAN - _HI_TEMP_MIN
+                return array('d', [table[base + t] if _HI_TEMP_MIN <= t <= _HI_TEMP_MAX
+                                   else heat_index_fahrenheit(t, rh) for t in highs])
+            return array('d', [heat_index_fahrenheit(t, rh) for t in highs])
+        
+        if len(relative_humidity) != len(highs):
+            raise ValueError("relative_humidity must have one value per record-day")
+        return array('d', [
+            table[rh * _HI_SPAN - _HI_TEMP_MIN + t]
+            if (isinstance(rh, int) and 0 <= rh <= _HI_RH_MAX
+                and _HI_TEMP_MIN <= t <= _HI_TEMP_MAX)
+            else heat_index_fahrenheit(t, rh)
+            for t, rh in zip(highs, relative_humidity)])